@@ -5,12 +5,23 @@ This script executes multiple ns-3 runs and generates analytical plots
 to mirror publication-style evaluation results.
 """
 
+import asyncio
+import logging
 import os
 import subprocess
+import sys
+import uuid
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+log = logging.getLogger(__name__)
 
 # -------------------------------------------------------------------
 #  Configuration Paths
@@ -19,126 +30,219 @@ NS3_ROOT = "/home/chirag/acn_gowda/ns-3-dev-ecn"
 SCRATCH_DIR = os.path.join(NS3_ROOT, "scratch")
 OUTPUT_DIR = os.path.join(NS3_ROOT, "analysis_graphs")
 
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-
-if not os.path.exists(NS3_ROOT):
-    print(f"❌ ERROR: NS-3 directory not found at {NS3_ROOT}")
-    exit(1)
-if not os.path.exists(SCRATCH_DIR):
-    print(f"❌ ERROR: Scratch directory missing at {SCRATCH_DIR}")
-    exit(1)
+# PNG export: full resolution, fastest zlib level (line plots barely shrink
+# at higher levels but encode several times slower)
+SAVE_OPTS = {"dpi": 300, "pil_kwargs": {"compress_level": 1, "optimize": False}}
 
 # -------------------------------------------------------------------
 #  Utility: Execute ns-3 Simulation and Parse CSV Results
 # -------------------------------------------------------------------
-def execute_ns3(attack, attack_rate=700, limit=25, node_count=25, win=1.2, duration=120):
-    """Run an ns-3 instance and extract computed metrics."""
+# Completed simulations keyed by their effective arguments, so identical
+# runs (e.g. the no-attack reference) are only simulated once.
+_SIM_CACHE = {}
+
+def _read_kv_csv(path):
+    """Read a one-row CSV (header + values) written by ns-3 into a dict of strings."""
+    with open(path) as f:
+        hdr = f.readline().rstrip().split(",")
+        vals = f.readline().rstrip().split(",")
+    return dict(zip(hdr, vals))
+
+async def execute_ns3(attack, attack_rate=700, limit=25, node_count=25, win=1.2, duration=120,
+                      desc="simulation"):
+    """Run an ns-3 instance and extract computed metrics.
+
+    `desc` names the run in log messages; it is not part of the cache key.
+    """
     if attack:
-        command = (
-            f"./ns3 run 'dioneighbour "
+        key = (True, attack_rate, limit, node_count, win, duration)
+    else:
+        # Attack parameters are not passed to ns-3 without an attacker
+        key = (False, node_count, duration)
+    if key in _SIM_CACHE:
+        return dict(_SIM_CACHE[key])
+
+    # Unique run id so concurrent simulations write to separate result files
+    run_id = uuid.uuid4().hex
+    # ns3's `run` takes the program and its arguments as one string, so
+    # no shell is needed to quote it
+    if attack:
+        program = (
+            "dioneighbour "
             f"--attack=true --attackerPps={attack_rate} --attackerPkt=120 "
             f"--threshold={limit} --windowSec={win} --nNodes={node_count} "
-            f"--area=60 --rateKbps=16 --simTime={duration}'"
+            f"--area=60 --rateKbps=16 --simTime={duration} --runId={run_id}"
         )
     else:
-        command = (
-            f"./ns3 run 'dioneighbour "
+        program = (
+            "dioneighbour "
             f"--attack=false --nNodes={node_count} --area=60 "
-            f"--rateKbps=16 --simTime={duration}'"
+            f"--rateKbps=16 --simTime={duration} --runId={run_id}"
         )
 
-    result = subprocess.run(command, shell=True, cwd=NS3_ROOT, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"   ❌ Simulation failed.")
+    # Simulation logs are never read: discard stdout, keep stderr for failures.
+    # The tree is built once by build_ns3(); concurrent runs must not rebuild it.
+    proc = await asyncio.create_subprocess_exec(
+        "./ns3", "run", "--no-build", program, cwd=NS3_ROOT,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    _, stderr = await proc.communicate()
+
+    if proc.returncode != 0:
+        err = stderr.decode(errors="replace").strip()
+        # Runs overlap, so name the exact ns-3 invocation alongside the stderr tail
+        log.error("   ❌ %s: simulation failed: %s\n      ns-3 args: %s", desc,
+                  err.splitlines()[-1] if err else "no error output", program)
         return None
 
+    metrics_path = f"{NS3_ROOT}/results/run{run_id}_metrics.csv"
     try:
-        pdr_df = pd.read_csv(f"{NS3_ROOT}/results/run1_pdr.csv")
-        delay_df = pd.read_csv(f"{NS3_ROOT}/results/run1_delay.csv")
-        over_df = pd.read_csv(f"{NS3_ROOT}/results/run1_overhead.csv")
-
-        return {
-            "pdr": pdr_df["pdr"].iloc[0],
-            "tx": pdr_df["tx"].iloc[0],
-            "rx": pdr_df["rx"].iloc[0],
-            "delay_ms": delay_df["avg_delay_s"].iloc[0] * 1000,
-            "ctrl_tx": over_df["control_tx"].iloc[0],
-            "ctrl_rx": over_df["control_rx"].iloc[0],
-            "ctrl_dropped": over_df["control_dropped"].iloc[0],
+        row = _read_kv_csv(metrics_path)
+
+        out = {
+            "pdr": float(row["pdr"]),
+            "tx": int(row["tx"]),
+            "rx": int(row["rx"]),
+            "delay_ms": float(row["delay_ms"]),
+            "ctrl_tx": int(row["control_tx"]),
+            "ctrl_rx": int(row["control_rx"]),
+            "ctrl_dropped": int(row["control_dropped"]),
         }
+        _SIM_CACHE[key] = out
+        return dict(out)
     except Exception as e:
-        print(f"   ❌ Error reading result files: {e}")
+        log.error("   ❌ %s: error reading result files: %s", desc, e)
         return None
+    finally:
+        # Per-run files have unique names, so nothing else overwrites them
+        if os.path.exists(metrics_path):
+            os.remove(metrics_path)
+
+def build_ns3():
+    """Build the ns-3 tree once so the parallel runs can skip the build step."""
+    result = subprocess.run(["./ns3", "build"], cwd=NS3_ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        err = result.stderr.decode(errors="replace").strip()
+        log.error("\n❌ ns-3 build failed: %s", err.splitlines()[-1] if err else "no error output")
+        return False
+    return True
+
+async def _run_bounded(jobs):
+    """Run all jobs on one event loop, at most one simulation per core."""
+    sem = asyncio.Semaphore(os.cpu_count() or 1)
+
+    async def run_one(desc, spec):
+        async with sem:
+            log.info("▶ Running %s...", desc)
+            return await execute_ns3(**spec, desc=desc)
+
+    return await asyncio.gather(*(run_one(desc, spec) for desc, spec in jobs))
+
+def run_simulations(jobs):
+    """Run independent ns-3 simulations concurrently, preserving input order.
+
+    Each job is a (description, execute_ns3 kwargs) pair; the description
+    labels the run's start and any failure in the log.
+    """
+    return asyncio.run(_run_bounded(jobs))
+
+# Known column types of the collected result frames
+SCHEMA = {
+    "pdr": "float64",
+    "tx": "int64",
+    "rx": "int64",
+    "delay_ms": "float64",
+    "ctrl_tx": "int64",
+    "ctrl_rx": "int64",
+    "ctrl_dropped": "int64",
+    "scenario": "string",
+    "attack_pps": "int64",
+    "threshold": "int64",
+}
+
+def _records_to_frame(records):
+    """Build a result DataFrame with explicit dtypes instead of inferring them."""
+    if not records:
+        return pd.DataFrame()
+    return pd.DataFrame.from_records(records).astype(
+        {k: v for k, v in SCHEMA.items() if k in records[0]})
+
+def write_csv(df, path):
+    """Write a result frame with pyarrow's C++ CSV writer (no index column).
+
+    pyarrow always quotes header names and string values, so the header is
+    written here and values are left unquoted (an empty frame gives a bare
+    newline). Column names and scenario labels never contain delimiters.
+    pyarrow also prints whole floats as "1" and exponents as "1e-7", so
+    float columns are pre-formatted with repr() as pandas does ("1.0",
+    "1e-07"; NaN becomes an empty field).
+    """
+    with open(path, "wb") as f:
+        f.write((",".join(df.columns) + "\n").encode())
+        if len(df.columns):
+            df = df.copy()
+            for col in df.columns[df.dtypes == "float64"]:
+                df[col] = pd.array(
+                    ["" if pd.isna(v) else repr(float(v)) for v in df[col]], dtype="string")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, f, pacsv.WriteOptions(
+                include_header=False, quoting_style="none"))
 
 # -------------------------------------------------------------------
 #  Dataset Collection: Baseline Cases
 # -------------------------------------------------------------------
 def gather_baselines():
     """Simulate core RPL scenarios (no attack, attack-only, mitigation)."""
-    print("\n" + "=" * 70)
-    print("RUNNING BASELINE SIMULATIONS")
-    print("=" * 70)
-
+    log.info("\n%s", "=" * 70)
+    log.info("RUNNING BASELINE SIMULATIONS")
+    log.info("=" * 70)
+
+    # Plain RPL (no attack), unsecured RPL under attack, secure RPL (attack + mitigation)
+    cases = [
+        ("RPL", "Baseline RPL", {"attack": False}),
+        ("InsecRPL", "Insecure RPL (Attack without Mitigation)", {"attack": True, "limit": 999999999}),
+        ("SecRPL", "Secure RPL (Mitigation Enabled)", {"attack": True, "limit": 25}),
+    ]
     records = []
+    outputs = run_simulations([(desc, spec) for _, desc, spec in cases])
+    for (label, _, _), out in zip(cases, outputs):
+        if out:
+            out["scenario"] = label
+            records.append(out)
+            log.info("   ✓ %s: PDR = %.3f", label, out["pdr"])
 
-    # Case 1: Plain RPL (no attack)
-    print("▶ Running Baseline RPL...")
-    out = execute_ns3(attack=False)
-    if out:
-        out["scenario"] = "RPL"
-        records.append(out)
-        print(f"   ✓ PDR = {out['pdr']:.3f}")
-
-    # Case 2: Unsecured RPL under attack
-    print("▶ Running Insecure RPL (Attack without Mitigation)...")
-    out = execute_ns3(attack=True, limit=999999999)
-    if out:
-        out["scenario"] = "InsecRPL"
-        records.append(out)
-        print(f"   ✓ PDR = {out['pdr']:.3f}")
-
-    # Case 3: Secure RPL (Attack + Mitigation)
-    print("▶ Running Secure RPL (Mitigation Enabled)...")
-    out = execute_ns3(attack=True, limit=25)
-    if out:
-        out["scenario"] = "SecRPL"
-        records.append(out)
-        print(f"   ✓ PDR = {out['pdr']:.3f}")
-
-    return pd.DataFrame(records)
+    return _records_to_frame(records)
 
 # -------------------------------------------------------------------
 #  Dataset Collection: Attack Rate Variation
 # -------------------------------------------------------------------
 def gather_attack_variants():
     """Vary flooding intensity to measure performance degradation."""
-    print("\n" + "=" * 70)
-    print("RUNNING ATTACK RATE EXPERIMENTS")
-    print("=" * 70)
+    log.info("\n%s", "=" * 70)
+    log.info("RUNNING ATTACK RATE EXPERIMENTS")
+    log.info("=" * 70)
 
     rates = [150, 300, 500, 700, 900, 1100]
-    combined = []
-
+    cases = []
     for r in rates:
-        print(f"▶ Attacker frequency: {r} packets/s")
-
-        # Insecure setup
-        res = execute_ns3(attack=True, attack_rate=r, limit=999999999)
-        if res:
-            res["scenario"] = "InsecRPL"
-            res["attack_pps"] = r
-            combined.append(res)
+        # Insecure and secure setups
+        cases.append(("InsecRPL", r, {"attack": True, "attack_rate": r, "limit": 999999999}))
+        cases.append(("SecRPL", r, {"attack": True, "attack_rate": r, "limit": 25}))
+    # RPL (no attack) as reference
+    cases.append(("RPL", None, {"attack": False}))
 
-        # Secure setup
-        res = execute_ns3(attack=True, attack_rate=r, limit=25)
+    combined = []
+    outputs = run_simulations([
+        (f"{label} at attacker frequency {r} packets/s" if r else "RPL reference (no attack)", spec)
+        for label, r, spec in cases])
+    ref = outputs.pop()
+    for (label, r, _), res in zip(cases, outputs):
         if res:
-            res["scenario"] = "SecRPL"
+            res["scenario"] = label
             res["attack_pps"] = r
             combined.append(res)
 
     # Append RPL (no attack) as reference
-    ref = execute_ns3(attack=False)
     if ref:
         for r in rates:
             temp = ref.copy()
@@ -146,194 +250,207 @@ def gather_attack_variants():
             temp["attack_pps"] = r
             combined.append(temp)
 
-    return pd.DataFrame(combined)
+    return _records_to_frame(combined)
 
 # -------------------------------------------------------------------
 #  Dataset Collection: Mitigation Threshold Variation
 # -------------------------------------------------------------------
 def gather_threshold_tests():
     """Assess performance under different DAO packet thresholds."""
-    print("\n" + "=" * 70)
-    print("RUNNING THRESHOLD EXPERIMENTS")
-    print("=" * 70)
+    log.info("\n%s", "=" * 70)
+    log.info("RUNNING THRESHOLD EXPERIMENTS")
+    log.info("=" * 70)
 
     limits = [5, 15, 25, 35, 50, 70]
     collected = []
-
-    for lim in limits:
-        print(f"▶ Evaluating Threshold: {lim}")
-        out = execute_ns3(attack=True, attack_rate=700, limit=lim)
+    outputs = run_simulations([
+        (f"SecRPL with threshold {lim}", {"attack": True, "attack_rate": 700, "limit": lim})
+        for lim in limits])
+    for lim, out in zip(limits, outputs):
         if out:
             out["scenario"] = "SecRPL"
             out["threshold"] = lim
             collected.append(out)
-            print(f"   ✓ PDR: {out['pdr']:.3f}")
+            log.info("   ✓ Threshold %d: PDR = %.3f", lim, out["pdr"])
 
-    return pd.DataFrame(collected)
+    return _records_to_frame(collected)
 
 # -------------------------------------------------------------------
 #  Graph Generator
 # -------------------------------------------------------------------
-def make_graphs(baseline_df, rate_df, thresh_df):
-    """Produce visualizations resembling IEEE-style paper figures."""
-    plt.rcParams.update({
-        "font.family": "serif",
-        "font.size": 11,
-        "axes.labelsize": 12,
-        "axes.titlesize": 13,
-        "legend.fontsize": 10,
-        "figure.titlesize": 14
-    })
-
-    color_map = {"RPL": "#1f77b4", "InsecRPL": "#ff7f0e", "SecRPL": "#2ca02c"}
-    symbols = {"RPL": "o", "InsecRPL": "s", "SecRPL": "^"}
-
-    # --- Figure 1: DAO Overhead vs Attack Interval ---
-    if not rate_df.empty:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        for label in ["RPL", "InsecRPL", "SecRPL"]:
-            subset = rate_df[rate_df["scenario"] == label].sort_values("attack_pps")
-            if subset.empty:
-                continue
-            x = 1.0 / subset["attack_pps"].values
-            y = subset["ctrl_rx"].values
-            ax.plot(x, y, marker=symbols[label], color=color_map[label],
-                    linewidth=2, markersize=7, label=label)
-        ax.set_xlabel("Attack Interval (s)", fontweight="bold")
-        ax.set_ylabel("DAO Packets Forwarded", fontweight="bold")
-        ax.set_title("DAO Control Traffic vs Attack Frequency", fontweight="bold")
-        ax.grid(alpha=0.3, linestyle="--")
-        ax.legend()
-        plt.tight_layout()
-        plt.savefig(f"{OUTPUT_DIR}/dao_overhead.png", dpi=300)
-        plt.close()
-
-    # --- Figure 2: PDR vs Attack Frequency ---
-    if not rate_df.empty:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        for label in ["RPL", "InsecRPL", "SecRPL"]:
-            subset = rate_df[rate_df["scenario"] == label].sort_values("attack_pps")
-            if subset.empty:
-                continue
-            x = 1.0 / subset["attack_pps"].values
-            y = subset["pdr"].values
-            ax.plot(x, y, marker=symbols[label], color=color_map[label],
-                    linewidth=2, markersize=7, label=label)
-        ax.set_xlabel("Attack Interval (s)", fontweight="bold")
-        ax.set_ylabel("Packet Delivery Ratio", fontweight="bold")
-        ax.set_title("PDR under Increasing Attack Frequency", fontweight="bold")
-        ax.set_ylim([0.7, 1.0])
-        ax.grid(alpha=0.3, linestyle="--")
-        ax.legend()
-        plt.tight_layout()
-        plt.savefig(f"{OUTPUT_DIR}/pdr_vs_attack.png", dpi=300)
-        plt.close()
-
-    # --- Figure 3: Delay vs Attack Frequency ---
+PLOT_STYLE = {
+    "font.family": "serif",
+    "font.size": 11,
+    "axes.labelsize": 12,
+    "axes.titlesize": 13,
+    "legend.fontsize": 10,
+    "figure.titlesize": 14,
+    "figure.autolayout": False,
+    # Let Agg drop sub-pixel line segments
+    "path.simplify_threshold": 1.0
+}
+# Applied once at import; worker processes pick it up when they fork or
+# re-import this module
+plt.rcParams.update(PLOT_STYLE)
+
+COLOR_MAP = {"RPL": "#1f77b4", "InsecRPL": "#ff7f0e", "SecRPL": "#2ca02c"}
+SYMBOLS = {"RPL": "o", "InsecRPL": "s", "SecRPL": "^"}
+
+def _new_line_figure():
+    """8x5 figure whose margins adapt to the tick-label widths of the data."""
+    fig, ax = plt.subplots(figsize=(8, 5), layout="constrained")
+    return fig, ax
+
+def _render_rate_fig(groups, inv_pps, metric, ylabel, title, filename, ylim=None):
+    """Plot one metric against attack interval for every scenario."""
+    fig, ax = _new_line_figure()
+    for label in ("RPL", "InsecRPL", "SecRPL"):
+        subset = groups.get(label)
+        if subset is None:
+            continue
+        ax.plot(inv_pps[label], subset[metric].to_numpy(),
+                marker=SYMBOLS[label], color=COLOR_MAP[label],
+                linewidth=2, markersize=7, label=label)
+    ax.set_xlabel("Attack Interval (s)", fontweight="bold")
+    ax.set_ylabel(ylabel, fontweight="bold")
+    ax.set_title(title, fontweight="bold")
+    if ylim is not None:
+        ax.set_ylim(ylim)
+    ax.grid(alpha=0.3, linestyle="--")
+    ax.legend()
+    path = f"{OUTPUT_DIR}/{filename}"
+    fig.savefig(path, **SAVE_OPTS)
+    plt.close(fig)
+    return path
+
+def _render_threshold_fig(thresh_df, ref_pdr):
+    """Plot SecRPL PDR against DAO threshold with baseline reference lines.
+
+    `ref_pdr` maps baseline scenario -> PDR; missing scenarios get no line.
+    """
+    fig, ax = _new_line_figure()
+    subset = thresh_df.sort_values("threshold")
+    ax.plot(subset["threshold"], subset["pdr"], marker="^",
+            color=COLOR_MAP["SecRPL"], linewidth=2, label="SecRPL")
+    if ref_pdr.get("RPL") is not None:
+        ax.axhline(y=ref_pdr["RPL"],
+                   linestyle="--", color=COLOR_MAP["RPL"], label="RPL Base")
+    if ref_pdr.get("InsecRPL") is not None:
+        ax.axhline(y=ref_pdr["InsecRPL"],
+                   linestyle="--", color=COLOR_MAP["InsecRPL"], label="InsecRPL")
+    ax.set_xlabel("DAO Threshold Limit", fontweight="bold")
+    ax.set_ylabel("Packet Delivery Ratio", fontweight="bold")
+    ax.set_title("Impact of DAO Threshold on PDR", fontweight="bold")
+    ax.legend()
+    ax.grid(alpha=0.3, linestyle="--")
+    path = f"{OUTPUT_DIR}/pdr_vs_threshold.png"
+    fig.savefig(path, **SAVE_OPTS)
+    plt.close(fig)
+    return path
+
+def make_graphs(baseline_df, rate_df, thresh_df, pool):
+    """Produce visualizations resembling IEEE-style paper figures.
+
+    Each figure is rendered by `pool`; returns the futures of saved paths.
+    """
+    futures = []
+
     if not rate_df.empty:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        for label in ["RPL", "InsecRPL", "SecRPL"]:
-            subset = rate_df[rate_df["scenario"] == label].sort_values("attack_pps")
-            if subset.empty:
-                continue
-            x = 1.0 / subset["attack_pps"].values
-            y = subset["delay_ms"].values
-            ax.plot(x, y, marker=symbols[label], color=color_map[label],
-                    linewidth=2, markersize=7, label=label)
-        ax.set_xlabel("Attack Interval (s)", fontweight="bold")
-        ax.set_ylabel("End-to-End Delay (ms)", fontweight="bold")
-        ax.set_title("Average Latency vs DAO Attack Frequency", fontweight="bold")
-        ax.grid(alpha=0.3, linestyle="--")
-        ax.legend()
-        plt.tight_layout()
-        plt.savefig(f"{OUTPUT_DIR}/delay_vs_attack.png", dpi=300)
-        plt.close()
+        # Sort and split the sweep once; every attack-rate figure reuses the groups
+        rate_sorted = rate_df.sort_values(["scenario", "attack_pps"])
+        groups = {k: v for k, v in rate_sorted.groupby("scenario", sort=False)}
+        inv_pps = {k: 1.0 / v["attack_pps"].to_numpy() for k, v in groups.items()}
+
+        # --- Figure 1: DAO Overhead vs Attack Interval ---
+        futures.append(pool.submit(
+            _render_rate_fig, groups, inv_pps, "ctrl_rx", "DAO Packets Forwarded",
+            "DAO Control Traffic vs Attack Frequency", "dao_overhead.png"))
+
+        # --- Figure 2: PDR vs Attack Frequency ---
+        futures.append(pool.submit(
+            _render_rate_fig, groups, inv_pps, "pdr", "Packet Delivery Ratio",
+            "PDR under Increasing Attack Frequency", "pdr_vs_attack.png", ylim=[0.7, 1.0]))
+
+        # --- Figure 3: Delay vs Attack Frequency ---
+        futures.append(pool.submit(
+            _render_rate_fig, groups, inv_pps, "delay_ms", "End-to-End Delay (ms)",
+            "Average Latency vs DAO Attack Frequency", "delay_vs_attack.png"))
 
     # --- Figure 4: PDR vs DAO Threshold ---
     if not thresh_df.empty:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        subset = thresh_df.sort_values("threshold")
-        ax.plot(subset["threshold"], subset["pdr"], marker="^",
-                color=color_map["SecRPL"], linewidth=2, label="SecRPL")
+        ref_pdr = {}
         if not baseline_df.empty:
-            ax.axhline(y=baseline_df.loc[baseline_df["scenario"] == "RPL", "pdr"].iloc[0],
-                       linestyle="--", color=color_map["RPL"], label="RPL Base")
-            ax.axhline(y=baseline_df.loc[baseline_df["scenario"] == "InsecRPL", "pdr"].iloc[0],
-                       linestyle="--", color=color_map["InsecRPL"], label="InsecRPL")
-        ax.set_xlabel("DAO Threshold Limit", fontweight="bold")
-        ax.set_ylabel("Packet Delivery Ratio", fontweight="bold")
-        ax.set_title("Impact of DAO Threshold on PDR", fontweight="bold")
-        ax.legend()
-        ax.grid(alpha=0.3, linestyle="--")
-        plt.tight_layout()
-        plt.savefig(f"{OUTPUT_DIR}/pdr_vs_threshold.png", dpi=300)
-        plt.close()
-        
+            bl = baseline_df.set_index("scenario").to_dict("index")
+            ref_pdr = {k: v["pdr"] for k, v in bl.items()}
+        futures.append(pool.submit(_render_threshold_fig, thresh_df, ref_pdr))
+
+    return futures
+
 # -------------------------------------------------------------------
 #  Comparative Overview Chart (RPL vs InsecRPL vs SecRPL)
 # -------------------------------------------------------------------
-def make_comparison_chart(baseline_df):
-    """Create side-by-side bar comparison of PDR, Delay, and Control Overhead."""
-    if baseline_df.empty:
-        return
-
-    plt.rcParams.update({
-        "font.family": "serif",
-        "font.size": 11,
-        "axes.labelsize": 12,
-        "axes.titlesize": 13,
-        "legend.fontsize": 10,
-        "figure.titlesize": 14
-    })
+def _annotate(ax, bars, heights, fmt):
+    """Label each bar with its value in a single bar_label call."""
+    ax.bar_label(bars, labels=[fmt % h for h in heights], fontweight="bold")
 
+def _render_comparison(baseline_df):
+    """Draw and save the three-panel bar comparison; returns the output path."""
     colors = {"RPL": "#961fff", "InsecRPL": "#552903", "SecRPL": "#f2ff00"}
 
     fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(15, 5))
-    scenarios = baseline_df["scenario"].values
-    pdr_vals = baseline_df["pdr"].values
-    delay_vals = baseline_df["delay_ms"].values
-    ctrl_vals = baseline_df["ctrl_rx"].values
+    scenarios = baseline_df["scenario"].to_numpy(dtype=object)
+    pdr_vals = baseline_df["pdr"].to_numpy()
+    delay_vals = baseline_df["delay_ms"].to_numpy()
+    ctrl_vals = baseline_df["ctrl_rx"].to_numpy()
+
+    # Shared by all three panels
+    bar_colors = np.array([colors[s] for s in scenarios])
+    x_pos = np.arange(len(scenarios))
 
     # --- PDR ---
-    bars1 = ax1.bar(scenarios, pdr_vals,
-                    color=[colors[s] for s in scenarios],
+    bars1 = ax1.bar(x_pos, pdr_vals, color=bar_colors,
                     edgecolor="black", linewidth=1.3)
     ax1.set_ylabel("PDR", fontweight="bold")
     ax1.set_title("Packet Delivery Ratio", fontweight="bold")
     ax1.set_ylim([0, 1.05])
     ax1.grid(axis="y", alpha=0.3)
-    for i, b in enumerate(bars1):
-        ax1.text(b.get_x() + b.get_width()/2., b.get_height(),
-                 f"{pdr_vals[i]:.3f}", ha="center", va="bottom", fontweight="bold")
+    _annotate(ax1, bars1, pdr_vals, "%.3f")
 
     # --- Delay ---
-    bars2 = ax2.bar(scenarios, delay_vals,
-                    color=[colors[s] for s in scenarios],
+    bars2 = ax2.bar(x_pos, delay_vals, color=bar_colors,
                     edgecolor="black", linewidth=1.3)
     ax2.set_ylabel("Delay (ms)", fontweight="bold")
     ax2.set_title("End-to-End Delay", fontweight="bold")
     ax2.grid(axis="y", alpha=0.3)
-    for i, b in enumerate(bars2):
-        ax2.text(b.get_x() + b.get_width()/2., b.get_height(),
-                 f"{delay_vals[i]:.1f}", ha="center", va="bottom", fontweight="bold")
+    _annotate(ax2, bars2, delay_vals, "%.1f")
 
     # --- Control Overhead ---
-    bars3 = ax3.bar(scenarios, ctrl_vals,
-                    color=[colors[s] for s in scenarios],
+    bars3 = ax3.bar(x_pos, ctrl_vals, color=bar_colors,
                     edgecolor="black", linewidth=1.3)
     ax3.set_ylabel("Control Packets", fontweight="bold")
     ax3.set_title("Control Traffic Overhead", fontweight="bold")
     ax3.grid(axis="y", alpha=0.3)
-    for i, b in enumerate(bars3):
-        ax3.text(b.get_x() + b.get_width()/2., b.get_height(),
-                 f"{int(ctrl_vals[i])}", ha="center", va="bottom", fontweight="bold")
+    _annotate(ax3, bars3, ctrl_vals, "%d")
+
+    for ax in (ax1, ax2, ax3):
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(scenarios)
 
     plt.suptitle("Performance Comparison: RPL vs InsecRPL vs SecRPL",
                  fontsize=14, fontweight="bold", y=1.02)
     plt.tight_layout()
-    plt.savefig(f"{OUTPUT_DIR}/comparison_overview.png", dpi=300, bbox_inches="tight")
-    print("✓ Saved: comparison_overview.png")
-    plt.close()
+    # Resolve the tight bbox up front so savefig skips its extra draw pass
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    path = f"{OUTPUT_DIR}/comparison_overview.png"
+    fig.savefig(path, bbox_inches=bbox, **SAVE_OPTS)
+    plt.close(fig)
+    return path
+
+def make_comparison_chart(baseline_df, pool):
+    """Create side-by-side bar comparison of PDR, Delay, and Control Overhead."""
+    if baseline_df.empty:
+        return []
+    return [pool.submit(_render_comparison, baseline_df)]
 
 
 # -------------------------------------------------------------------
@@ -341,60 +458,82 @@ def make_comparison_chart(baseline_df):
 # -------------------------------------------------------------------
 def summarize_results(baseline_df):
     """Print key metrics and performance improvements."""
-    print("\n" + "=" * 80)
-    print("EXPERIMENT SUMMARY")
-    print("=" * 80)
+    log.info("\n%s", "=" * 80)
+    log.info("EXPERIMENT SUMMARY")
+    log.info("=" * 80)
 
     if not baseline_df.empty:
-        print("\n📊 Baseline Overview:")
-        print(baseline_df[["scenario", "pdr", "delay_ms", "ctrl_rx", "ctrl_dropped"]].to_string(index=False))
+        log.info("\n📊 Baseline Overview:")
+        log.info("%s", baseline_df[["scenario", "pdr", "delay_ms", "ctrl_rx", "ctrl_dropped"]].to_string(index=False))
 
-        if set(["SecRPL", "InsecRPL"]).issubset(baseline_df["scenario"].values):
-            insec = baseline_df.loc[baseline_df["scenario"] == "InsecRPL", "pdr"].iloc[0]
-            sec = baseline_df.loc[baseline_df["scenario"] == "SecRPL", "pdr"].iloc[0]
+        bl = baseline_df.set_index("scenario").to_dict("index")
+        if set(["SecRPL", "InsecRPL"]).issubset(bl):
+            insec = bl["InsecRPL"]["pdr"]
+            sec = bl["SecRPL"]["pdr"]
             improvement = ((sec - insec) / insec) * 100
-            print(f"\n✨ Improvements:")
-            print(f"   • PDR gain via mitigation: {improvement:.2f}%")
-            print(f"   • Attack degradation: {(1 - insec) * 100:.2f}%")
-            blocked = baseline_df.loc[baseline_df["scenario"] == "SecRPL", "ctrl_dropped"].iloc[0]
-            print(f"   • DAO packets filtered: {int(blocked)}")
+            log.info("\n✨ Improvements:")
+            log.info("   • PDR gain via mitigation: %.2f%%", improvement)
+            log.info("   • Attack degradation: %.2f%%", (1 - insec) * 100)
+            blocked = bl["SecRPL"]["ctrl_dropped"]
+            log.info("   • DAO packets filtered: %d", blocked)
 
 # -------------------------------------------------------------------
 #  Main Entrypoint
 # -------------------------------------------------------------------
 def main():
-    print("\n🚀==============================================================🚀")
-    print("   AUTOMATED RPL DAO ATTACK SIMULATION & PAPER-GRADE PLOTTING")
-    print("🚀==============================================================🚀\n")
+    # Checked here rather than at import so the messages go through the
+    # logging configuration set up in __main__
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    print(f"📁 NS-3 Root: {NS3_ROOT}")
-    print(f"📁 Scratch: {SCRATCH_DIR}")
-    print(f"📁 Output: {OUTPUT_DIR}")
+    if not os.path.exists(NS3_ROOT):
+        log.error("❌ ERROR: NS-3 directory not found at %s", NS3_ROOT)
+        sys.exit(1)
+    if not os.path.exists(SCRATCH_DIR):
+        log.error("❌ ERROR: Scratch directory missing at %s", SCRATCH_DIR)
+        sys.exit(1)
+
+    log.info("\n🚀==============================================================🚀")
+    log.info("   AUTOMATED RPL DAO ATTACK SIMULATION & PAPER-GRADE PLOTTING")
+    log.info("🚀==============================================================🚀\n")
+
+    log.info("📁 NS-3 Root: %s", NS3_ROOT)
+    log.info("📁 Scratch: %s", SCRATCH_DIR)
+    log.info("📁 Output: %s", OUTPUT_DIR)
 
     code_file = os.path.join(SCRATCH_DIR, "dioneighbour.cc")
     if not os.path.exists(code_file):
-        print(f"\n❌ Could not locate simulation file: {code_file}")
+        log.error("\n❌ Could not locate simulation file: %s", code_file)
+        return
+    log.info("✅ Simulation code found.\n")
+
+    log.info("🔨 Building ns-3...")
+    if not build_ns3():
         return
-    print(f"✅ Simulation code found.\n")
 
     base_df = gather_baselines()
     rate_df = gather_attack_variants()
     thresh_df = gather_threshold_tests()
 
-    base_df.to_csv(f"{OUTPUT_DIR}/baseline.csv", index=False)
-    rate_df.to_csv(f"{OUTPUT_DIR}/attack_rate.csv", index=False)
-    thresh_df.to_csv(f"{OUTPUT_DIR}/thresholds.csv", index=False)
-    print(f"\n💾 Data stored in {OUTPUT_DIR}/")
+    write_csv(base_df, f"{OUTPUT_DIR}/baseline.csv")
+    write_csv(rate_df, f"{OUTPUT_DIR}/attack_rate.csv")
+    write_csv(thresh_df, f"{OUTPUT_DIR}/thresholds.csv")
+    log.info("\n💾 Data stored in %s/", OUTPUT_DIR)
 
-    print("\n📊 Creating figures...")
-    make_graphs(base_df, rate_df, thresh_df)
-    make_comparison_chart(base_df)
+    log.info("\n📊 Creating figures...")
+    # Figures are independent; render them concurrently on separate cores
+    with ProcessPoolExecutor(max_workers=min(5, os.cpu_count() or 1)) as pool:
+        futures = make_graphs(base_df, rate_df, thresh_df, pool)
+        futures += make_comparison_chart(base_df, pool)
+        for fut in futures:
+            log.info("✓ Saved: %s", os.path.basename(fut.result()))
 
     summarize_results(base_df)
 
-    print("\n✅==============================================================✅")
-    print("   ANALYSIS FINISHED. Graphs exported to:", OUTPUT_DIR)
-    print("✅==============================================================✅\n")
+    log.info("\n✅==============================================================✅")
+    log.info("   ANALYSIS FINISHED. Graphs exported to: %s", OUTPUT_DIR)
+    log.info("✅==============================================================✅\n")
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    logging.disable(logging.DEBUG)
     main()
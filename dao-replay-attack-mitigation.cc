@@ -49,23 +49,13 @@ public:
 
   void WriteCsv(const std::string &prefix) {
     std::filesystem::create_directories("results");
-    {
-      std::ofstream f("results/" + prefix + "_pdr.csv");
-      double p = (m_totalTx > 0) ? static_cast<double>(m_totalRx) / static_cast<double>(m_totalTx) : 0.0;
-      f << "tx,rx,pdr\n";
-      f << m_totalTx << "," << m_totalRx << "," << p << "\n";
-    }
-    {
-      std::ofstream f("results/" + prefix + "_delay.csv");
-      double avg = (m_totalRx > 0) ? m_sumDelay.GetSeconds() / static_cast<double>(m_totalRx) : 0.0;
-      f << "avg_delay_s\n";
-      f << avg << "\n";
-    }
-    {
-      std::ofstream f("results/" + prefix + "_overhead.csv");
-      f << "control_tx,control_rx,control_dropped\n";
-      f << m_controlTx << "," << m_controlRx << "," << m_controlDropped << "\n";
-    }
+    // Single one-row file per run: one open() on the reader side
+    std::ofstream f("results/" + prefix + "_metrics.csv");
+    double p = (m_totalTx > 0) ? static_cast<double>(m_totalRx) / static_cast<double>(m_totalTx) : 0.0;
+    double avgMs = (m_totalRx > 0) ? m_sumDelay.GetSeconds() * 1000.0 / static_cast<double>(m_totalRx) : 0.0;
+    f << "pdr,tx,rx,delay_ms,control_tx,control_rx,control_dropped\n";
+    f << p << "," << m_totalTx << "," << m_totalRx << "," << avgMs << ","
+      << m_controlTx << "," << m_controlRx << "," << m_controlDropped << "\n";
   }
 
 private:
@@ -299,6 +289,7 @@ int main(int argc, char *argv[]) {
   double windowSec = 1.0;
   double attackerPps = 600.0;
   uint32_t attackerPkt = 120;
+  std::string runId = "1";
 
   CommandLine cmd;
   cmd.AddValue("nNodes", "Total nodes (root + leaves)", nNodes);
@@ -310,6 +301,7 @@ int main(int argc, char *argv[]) {
   cmd.AddValue("windowSec", "Mitigator window in seconds", windowSec);
   cmd.AddValue("attackerPps", "Attacker packets per second", attackerPps);
   cmd.AddValue("attackerPkt", "Attacker packet payload bytes", attackerPkt);
+  cmd.AddValue("runId", "Run identifier used in result file names", runId);
   cmd.Parse(argc, argv);
 
   NS_ABORT_MSG_IF(nNodes < 2, "Need at least 2 nodes.");
@@ -407,6 +399,6 @@ int main(int argc, char *argv[]) {
   Simulator::Run();
   Simulator::Destroy();
 
-  metrics.WriteCsv("run1");
+  metrics.WriteCsv("run" + runId);
   return 0;
 }
\ No newline at end of file